@@ -1,84 +1,316 @@
 import os
 import json
-import glob
-import dash
-from dash import dcc, html, Input, Output, State
-import plotly.graph_objects as go
-import markdown
-import re
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+LEARNINGS_SUFFIX = "_learnings.json"
+SCAN_INDEX_FILE = ".learnings_index.json"
+# Files at least this large are searched through a memory map instead of being read whole
+MMAP_MIN_SIZE = 1 << 20
 
 class LearningContentViewer:
+    __slots__ = (
+        'directory_path', 'content_filter', 'type_filter', '_content_filter_needles',
+        'json_files', '_cache', '_filtered_files',
+        '_scan_index_path', '_scan_index', '_scan_index_dirty'
+    )
+    
     def __init__(self, directory_path, content_filter="Testing Frameworks", type_filter="tech_choices"):
         self.directory_path = directory_path
         self.content_filter = content_filter
         self.type_filter = type_filter
+        self._content_filter_needles = self._filter_needles(content_filter)
         self.json_files = self.get_json_files()
+        self._cache = {}
+        self._filtered_files = None
+        self._scan_index_path = os.path.join(directory_path, SCAN_INDEX_FILE)
+        self._scan_index = self._load_scan_index()
+        self._scan_index_dirty = False
+    
+    @staticmethod
+    def _filter_needles(content_filter):
+        """Byte patterns the filter text can appear as in a JSON file, raw or with JSON string escapes."""
+        return tuple(dict.fromkeys((
+            content_filter.encode('utf-8'),
+            json.dumps(content_filter, ensure_ascii=False)[1:-1].encode('utf-8'),
+            json.dumps(content_filter)[1:-1].encode('ascii')
+        )))
     
     def get_json_files(self):
-        """Get all JSON files in the specified directory."""
-        file_pattern = os.path.join(self.directory_path, "*_learnings.json")
-        files = glob.glob(file_pattern)
-        return [os.path.basename(f) for f in files]
+        """Get all JSON files in the specified directory, sorted by name."""
+        try:
+            with os.scandir(self.directory_path) as entries:
+                return sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith(LEARNINGS_SUFFIX) and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError) as e:
+            # Match glob's empty result so the app still starts and reports that no files were found
+            print(f"Error listing {self.directory_path}: {e}")
+            return []
+    
+    def _load_scan_index(self):
+        """Load the on-disk scan index, ignoring it if it was built for different filters."""
+        try:
+            with open(self._scan_index_path, 'rb') as f:
+                saved = _loads(f.read())
+            if saved.get("filters") != [self.content_filter, self.type_filter]:
+                return {}
+            return {
+                name: ((mtime, size), matched)
+                for name, (mtime, size, matched) in saved["files"].items()
+            }
+        except Exception:
+            return {}
+    
+    def save_scan_index(self):
+        """Write the scan index next to the learnings files so unchanged files are skipped on the next start."""
+        if not self._scan_index_dirty:
+            return
+        
+        current_files = set(self.json_files)
+        saved = {
+            "filters": [self.content_filter, self.type_filter],
+            "files": {
+                name: [mtime, size, matched]
+                for name, ((mtime, size), matched) in self._scan_index.items()
+                if name in current_files
+            }
+        }
+        # Write to a temporary file and swap it in, so readers never see a half-written index
+        tmp_path = f"{self._scan_index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(saved))
+            os.replace(tmp_path, self._scan_index_path)
+            self._scan_index_dirty = False
+        except OSError as e:
+            print(f"Could not write scan index {self._scan_index_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _scan_one(self, file_name):
+        """Return the file name if the file matches our filters, otherwise None."""
+        file_path = os.path.join(self.directory_path, file_name)
+        try:
+            stat = os.stat(file_path)
+            signature = (stat.st_mtime, stat.st_size)
+            known = self._scan_index.get(file_name)
+            if known is not None and known[0] == signature:
+                return file_name if known[1] else None
+            
+            with open(file_path, 'rb') as f:
+                raw = self._read_if_mentions_filter(f, stat.st_size)
+            # Files that never mention the filter text cannot match, so skip parsing them.
+            # Files that might match are parsed from the same buffer into the cache the viewer reuses later.
+            matched = (
+                raw is not None and
+                self.type_filter in self._parse_entry(file_name, stat.st_mtime, raw)[2]["filter_hit_types"]
+            )
+            if raw is not None and not matched:
+                # The text only appears under other types; such files are not listed, so do not keep them parsed
+                self._cache.pop(file_name, None)
+            self._scan_index[file_name] = (signature, matched)
+            self._scan_index_dirty = True
+            return file_name if matched else None
+        except Exception as e:
+            print(f"Error loading {file_name}: {e}")
+        return None
+    
+    def _read_if_mentions_filter(self, f, size):
+        """Return the bytes of an open file if they contain the filter text, otherwise None."""
+        needles = self._content_filter_needles
+        if size >= MMAP_MIN_SIZE:
+            # Searching the mapped pages means large files without a hit are never copied into memory
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if any(mm.find(needle) != -1 for needle in needles):
+                        return mm[:]
+                    return None
+            except (OSError, ValueError):
+                # Some file systems cannot be mapped, so fall back to reading the file
+                f.seek(0)
+        raw = f.read()
+        return raw if any(needle in raw for needle in needles) else None
+    
+    def _map_files(self, func, file_names):
+        """Apply func to each file name on a thread pool, returning the results in order."""
+        if not file_names:
+            return []
+        # Files are independent, so handle them concurrently to overlap disk reads
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, file_names))
     
     def filter_and_load_files(self):
         """Load all files and filter by content and type."""
-        filtered_files = []
+        if self._filtered_files is not None:
+            return self._filtered_files
         
-        for file_name in self.json_files:
-            file_path = os.path.join(self.directory_path, file_name)
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    # Check if any item matches our filters
-                    if any(
-                        isinstance(item, dict) and 
-                        item.get("type") == self.type_filter and
-                        "summary" in item and 
-                        isinstance(item["summary"], str) and
-                        self.content_filter in item["summary"]
-                        for item in data
-                    ):
-                        filtered_files.append(file_name)
-            except Exception as e:
-                print(f"Error loading {file_name}: {e}")
-                
+        results = self._map_files(self._scan_one, self.json_files)
+        filtered_files = [file_name for file_name in results if file_name]
+        
+        self.save_scan_index()
+        self._filtered_files = filtered_files
         return filtered_files
     
-    def load_json_file(self, file_name):
-        """Load all data from a selected JSON file."""
+    def _load_entry(self, file_name, need_items=True):
+        """Return the cached (mtime, data, index) entry for a file, reloading it when its mtime changes.
+        
+        Entries whose parsed items were released are reloaded as well when ``need_items`` is set.
+        """
         file_path = os.path.join(self.directory_path, file_name)
+        mtime = os.stat(file_path).st_mtime
+        cached = self._cache.get(file_name)
+        type_cache = None
+        if cached is not None and cached[0] == mtime:
+            if cached[1] is not None or not need_items:
+                return cached
+            # The file is unchanged, so the type cache built before the release still holds
+            type_cache = cached[2]["type_cache"]
+        
+        with open(file_path, 'rb') as f:
+            entry = self._parse_entry(file_name, mtime, f.read())
+        if type_cache is not None:
+            entry[2]["type_cache"] = type_cache
+        return entry
+    
+    def _parse_entry(self, file_name, mtime, raw):
+        """Parse the raw bytes of a file and cache them as its (mtime, data, index) entry."""
+        data = _loads(raw)
+        entry = (mtime, data, self.build_type_index(data))
+        self._cache[file_name] = entry
+        return entry
+    
+    def _error_data(self, error):
+        """Build the placeholder content shown when a file cannot be loaded."""
+        return [{"type": "error", "summary": f"Error loading file: {str(error)}", "data": None}]
+    
+    def load_json_file(self, file_name):
+        """Load all data from a selected JSON file, reusing the parsed copy while its mtime is unchanged."""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            return self._load_entry(file_name)[1]
         except Exception as e:
-            return [{"type": "error", "summary": f"Error loading file: {str(e)}", "data": None}]
+            return self._error_data(e)
     
-    def get_content_types(self, json_data):
-        """Get unique content types from the JSON data."""
-        if not json_data:
-            return []
-        types = set(item.get("type", "") for item in json_data if isinstance(item, dict))
-        return sorted([t for t in types if t])
+    def preload_files(self, file_names):
+        """Parse and index the given files concurrently so later lookups hit the cache."""
+        # Only the type caches are read afterwards, so released entries are not parsed again
+        self._map_files(lambda file_name: self.load_file_index(file_name, need_items=False), file_names)
     
-    def get_content_by_type(self, json_data, type_name):
-        """Get content items of the selected type."""
-        if not json_data:
-            return []
-        return [item for item in json_data if isinstance(item, dict) and item.get("type") == type_name]
+    def load_file_index(self, file_name, need_items=True):
+        """Load the type index of a selected JSON file.
+        
+        Pass ``need_items=False`` when only the memoized type cache is read, so a released entry is not reparsed.
+        """
+        try:
+            return self._load_entry(file_name, need_items)[2]
+        except Exception as e:
+            return self.build_type_index(self._error_data(e))
+    
+    def release_parsed_data(self, file_names):
+        """Drop the parsed items of files whose type cache is built, keeping only what the callbacks read."""
+        cache = self._cache
+        for file_name in file_names:
+            entry = cache.get(file_name)
+            if entry is None or entry[1] is None or entry[2]["type_cache"] is None:
+                continue
+            # The type cache shares the summary strings, so only the item dicts and groupings are freed
+            cache[file_name] = (entry[0], None, dict(entry[2], by_type=None))
+    
+    def build_type_index(self, json_data):
+        """Group items by type in a single pass and record which types contain the content filter."""
+        by_type = {}
+        filter_hit_types = set()
+        content_filter = self.content_filter
+        # Bound methods are looked up once rather than on every item
+        group_for = by_type.setdefault
+        add_hit = filter_hit_types.add
+        
+        for item in json_data or []:
+            try:
+                type_name = item["type"]
+                if not type_name:
+                    continue
+                group_for(type_name, []).append(item)
+            except (KeyError, TypeError):
+                continue
+            try:
+                if content_filter in item["summary"]:
+                    add_hit(type_name)
+            except (KeyError, TypeError):
+                pass
+        
+        return {
+            "types": sorted(by_type),
+            "by_type": by_type,
+            "filter_hit_types": filter_hit_types,
+            "type_cache": None
+        }
+    
+    def get_content_types(self, file_index):
+        """Get unique content types from a file index."""
+        return file_index["types"]
+    
+    def get_content_by_type(self, file_index, type_name):
+        """Get content items of the selected type from a file index."""
+        return file_index["by_type"].get(type_name, [])
+
 
+# Dash is imported lazily so the viewer and CLI help do not pay its import cost
+_app = None
 
-# Initialize Dash app
-app = dash.Dash(__name__, suppress_callback_exceptions=True)
-server = app.server  # For Gunicorn deployment
+def get_app():
+    """Create the Dash app on first use."""
+    global _app
+    if _app is None:
+        import dash
+        # The type caches are sent as JSON callback responses, so gzip them when dash[compress] is installed
+        try:
+            import flask_compress  # noqa: F401
+            compress = True
+        except ImportError:
+            compress = False
+        _app = dash.Dash(__name__, suppress_callback_exceptions=True, compress=compress)
+    return _app
+
+def __getattr__(name):
+    # Keep `app` and `server` importable as module attributes, e.g. for Gunicorn
+    if name == "app":
+        return get_app()
+    if name == "server":
+        return get_app().server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Define app layout
 def setup_dash_app(viewer):
+    import dash
+    from dash import dcc, html, Input, Output, State
+    
+    app = get_app()
+    
     # Filter files that match our criteria
     filtered_file_list = viewer.filter_and_load_files()
     
     # Use filtered files if available, otherwise use all files
     display_files = filtered_file_list if filtered_file_list else viewer.json_files
     
+    # The filtered set is small and static, so prepare it once instead of on first view
+    if filtered_file_list:
+        precompute_content(viewer, filtered_file_list)
+    
     # Create filter indicator message
     if filtered_file_list:
         filter_msg = f"Showing {len(filtered_file_list)} files containing '{viewer.content_filter}' in '{viewer.type_filter}' sections"
@@ -107,22 +339,28 @@ def setup_dash_app(viewer):
             html.Div(id='type-buttons', style={'display': 'flex', 'flexWrap': 'wrap', 'gap': '10px', 'marginTop': '10px'})
         ]),
         
-        html.Div(id='content-display', style={'marginTop': '20px', 'padding': '15px', 'border': '1px solid #ddd'})
+        html.Div(id='content-display', style={'marginTop': '20px', 'padding': '15px', 'border': '1px solid #ddd'}),
+        
+        # Raw per-type content of the selected file, formatted in the browser by the clientside renderer
+        dcc.Store(id='type-cache'),
+        dcc.Store(id='content-filter', data=viewer.content_filter)
     ])
     
     # Setup callbacks
     @app.callback(
-        Output('type-buttons', 'children'),
+        [
+            Output('type-buttons', 'children'),
+            Output('type-cache', 'data')
+        ],
         Input('file-dropdown', 'value')
     )
-    def update_type_buttons(selected_file):
+    def update_content(selected_file):
         if not selected_file:
-            return []
+            return [], None
         
-        json_data = viewer.load_json_file(selected_file)
-        types = viewer.get_content_types(json_data)
+        type_cache = get_type_cache(viewer, selected_file)
         
-        return [
+        buttons = [
             html.Button(
                 type_name,
                 id={'type': 'type-button', 'index': i},
@@ -135,101 +373,134 @@ def setup_dash_app(viewer):
                     'border': '1px solid #ccc',
                     'cursor': 'pointer'
                 }
-            ) for i, type_name in enumerate(types)
+            ) for i, type_name in enumerate(type_cache["types"])
         ]
+        
+        return buttons, type_cache
     
-    @app.callback(
+    # Content is only formatted for the type being viewed, in the browser, from the raw summaries
+    app.clientside_callback(
+        """
+        function(typeCache, buttonClicks, buttonTypes, contentFilter) {
+            const element = (type, children, props) => ({
+                type: type,
+                namespace: 'dash_html_components',
+                props: Object.assign({children: children}, props)
+            });
+            if (!typeCache) {
+                return element('P', 'Please select a file to view content');
+            }
+            
+            // A new file shows its default type, a button click shows the clicked type
+            const triggered = dash_clientside.callback_context.triggered;
+            let typeName = typeCache.default_type;
+            if (!triggered.some(t => t.prop_id === 'type-cache.data')) {
+                const clicked = triggered.find(t => t.value);
+                if (!clicked) {
+                    return dash_clientside.no_update;
+                }
+                const propId = clicked.prop_id;
+                typeName = buttonTypes[JSON.parse(propId.slice(0, propId.lastIndexOf('.'))).index];
+            }
+            
+            const section = typeCache.types[typeName];
+            if (!section) {
+                return element('P', 'No content found in the selected file');
+            }
+            
+            const children = [element('H2', section.title)];
+            if (section.note) {
+                children.push(element('P', `This section contains '${contentFilter}'`, {style: {fontStyle: 'italic'}}));
+            }
+            for (const summary of section.summaries) {
+                if (!section.highlight || !contentFilter || typeof summary !== 'string' || !summary.includes(contentFilter)) {
+                    children.push(element('P', summary));
+                    continue;
+                }
+                // Split by the filter term and put the highlight between the parts
+                const highlighted = [];
+                summary.split(contentFilter).forEach((part, i) => {
+                    if (i > 0) {
+                        highlighted.push(element('Strong', contentFilter));
+                    }
+                    highlighted.push(part);
+                });
+                children.push(element('P', highlighted));
+            }
+            return children;
+        }
+        """,
         Output('content-display', 'children'),
         [
-            Input('file-dropdown', 'value'),
+            Input('type-cache', 'data'),
             Input({'type': 'type-button', 'index': dash.dependencies.ALL}, 'n_clicks')
         ],
-        [State({'type': 'type-button', 'index': dash.dependencies.ALL}, 'children')]
+        [
+            State({'type': 'type-button', 'index': dash.dependencies.ALL}, 'children'),
+            State('content-filter', 'data')
+        ]
     )
-    def update_content(selected_file, button_clicks, button_types):
-        ctx = dash.callback_context
-        
-        if not selected_file:
-            return html.P("Please select a file to view content")
-        
-        json_data = viewer.load_json_file(selected_file)
-        
-        # Determine which type to display
-        selected_type = None
-        
-        if ctx.triggered and "type-button" in ctx.triggered[0]["prop_id"]:
-            # A type button was clicked
-            button_index = ctx.triggered_id['index']
-            if button_index < len(button_types):
-                selected_type = button_types[button_index]
-        else:
-            # Initial load or file dropdown change
-            # First look for type containing our filter text
-            matching_items = [
-                item for item in json_data 
-                if isinstance(item, dict) and 
-                item.get("type") == viewer.type_filter and
-                "summary" in item and
-                viewer.content_filter in item.get("summary", "")
-            ]
-            
-            if matching_items:
-                selected_type = viewer.type_filter
-            elif json_data and isinstance(json_data, list) and len(json_data) > 0:
-                types = viewer.get_content_types(json_data)
-                if types:
-                    selected_type = types[0]
-        
-        if not selected_type:
-            return html.P("No content found in the selected file")
-        
-        content_items = viewer.get_content_by_type(json_data, selected_type)
-        
-        if not content_items:
-            return html.P(f"No content found for type: {selected_type}")
-        
-        # Extract the filename without the _learnings.json suffix
-        repo_name = selected_file.replace('_learnings.json', '')
-        
-        # Prepare content
-        content_elements = []
-        
-        # Add header
-        content_elements.append(html.H2(f"{repo_name} - {selected_type.replace('_', ' ').title()}"))
-        
-        # Check if this type has our filter
-        has_matching_content = any(
-            viewer.content_filter in item.get("summary", "")
-            for item in content_items
-        )
-        
-        # Add note if this is our target type and has our filter
-        if selected_type == viewer.type_filter and has_matching_content:
-            content_elements.append(html.P(
-                f"This section contains '{viewer.content_filter}'",
-                style={'fontStyle': 'italic'}
-            ))
-        
-        # Add each item's summary
-        for item in content_items:
-            summary = item.get("summary", "No summary available")
-            
-            # Highlight the filtered content if present
-            if viewer.content_filter in summary and selected_type == viewer.type_filter:
-                # Split by the filter term to highlight it
-                parts = summary.split(viewer.content_filter)
-                highlighted_summary = []
-                
-                for i, part in enumerate(parts):
-                    highlighted_summary.append(html.Span(part))
-                    if i < len(parts) - 1:  # Don't add after the last part
-                        highlighted_summary.append(html.Strong(viewer.content_filter))
-                        
-                content_elements.append(html.P(highlighted_summary))
-            else:
-                content_elements.append(html.P(summary))
+
+def build_type_cache(viewer, file_name, file_index):
+    """Collect the raw summaries of every type in a file for the clientside renderer."""
+    # Listed files always end with the suffix, so slice it off rather than searching the name for it
+    repo_name = file_name[:-len(LEARNINGS_SUFFIX)] if file_name.endswith(LEARNINGS_SUFFIX) else file_name
+    filter_hit_types = file_index["filter_hit_types"]
+    type_filter = viewer.type_filter
+    
+    by_type = file_index["by_type"]
+    
+    types = {
+        type_name: {
+            "title": f"{repo_name} - {type_name.replace('_', ' ').title()}",
+            "note": type_name == type_filter and type_name in filter_hit_types,
+            "highlight": type_name == type_filter,
+            "summaries": [item.get("summary", "No summary available") for item in by_type[type_name]]
+        }
+        for type_name in viewer.get_content_types(file_index)
+    }
+    
+    # Show the type containing our filter text first, otherwise the first type
+    if type_filter in filter_hit_types:
+        default_type = type_filter
+    else:
+        default_type = next(iter(types), None)
+    
+    return {"default_type": default_type, "types": types}
+
+def get_type_cache(viewer, file_name):
+    """Return the type cache of a file, memoized alongside the file's cached index."""
+    file_index = viewer.load_file_index(file_name, need_items=False)
+    if file_index["type_cache"] is None:
+        file_index["type_cache"] = build_type_cache(viewer, file_name, file_index)
+    return file_index["type_cache"]
+
+def run_production_server(host, port, workers, threads):
+    """Serve the Dash app with Gunicorn worker processes instead of the single Flask dev server."""
+    from gunicorn.app.base import BaseApplication
+    
+    server = get_app().server
+    
+    class DashApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("threads", threads)
         
-        return content_elements
+        def load(self):
+            return server
+    
+    DashApplication().run()
+
+def precompute_content(viewer, file_names, drop_parsed=True):
+    """Build the type caches of the given files up front so callbacks only read memoized content."""
+    # Files skipped by the scan index have not been parsed yet, so load those in parallel first
+    viewer.preload_files(file_names)
+    for file_name in file_names:
+        get_type_cache(viewer, file_name)
+    # The callbacks only read the type caches, so the parsed items need not stay pinned for the app's lifetime
+    if drop_parsed:
+        viewer.release_parsed_data(file_names)
 
 # Main function to run app
 def main():
@@ -245,6 +516,12 @@ def main():
                         help='Port to run the server on')
     parser.add_argument('--host', default='0.0.0.0',
                         help='Host to run the server on')
+    parser.add_argument('--prod', action='store_true',
+                        help='Serve with Gunicorn instead of the Flask debug server')
+    parser.add_argument('--workers', default=os.cpu_count() or 1, type=int,
+                        help='Number of Gunicorn worker processes (with --prod)')
+    parser.add_argument('--threads', default=4, type=int,
+                        help='Number of threads per Gunicorn worker (with --prod)')
     
     args = parser.parse_args()
     
@@ -257,7 +534,10 @@ def main():
     setup_dash_app(viewer)
     
     # Run the app
-    app.run(debug=True, host=args.host, port=args.port)
+    if args.prod:
+        run_production_server(args.host, args.port, args.workers, args.threads)
+    else:
+        get_app().run(debug=True, host=args.host, port=args.port)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -3,8 +3,17 @@ class LearningContentViewer {
         this.dataDirectory = dataDirectory;
         this.contentFilter = contentFilter;
         this.typeFilter = typeFilter;
+        
+        // Build the highlight pattern once; the filter is matched literally, not as a regex
+        this.highlightPattern = contentFilter
+            ? new RegExp(contentFilter.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'g')
+            : null;
+        this.highlightHtml = `<span class="highlight">${contentFilter}</span>`;
+        
         this.jsonFiles = [];
         this.currentJsonData = null;
+        this.currentItemsByType = new Map();
+        this.sampleData = null;
         
         this.fileSelect = document.getElementById('file-select');
         this.typeButtonsContainer = document.getElementById('type-buttons');
@@ -116,7 +125,8 @@ class LearningContentViewer {
     }
     
     useSampleData() {
-        this.jsonFiles = Object.keys(SAMPLE_DATA);
+        this.sampleData = this.loadSampleData();
+        this.jsonFiles = Object.keys(this.sampleData);
         
         // Update filter info
         this.updateFilterInfo(this.jsonFiles.length);
@@ -137,23 +147,28 @@ class LearningContentViewer {
         if (this.jsonFiles.length > 0) {
             const firstFile = this.jsonFiles[0];
             this.fileSelect.value = firstFile;
-            this.currentJsonData = SAMPLE_DATA[firstFile];
+            this.setCurrentData(this.sampleData[firstFile]);
             this.updateTypeButtons();
             this.displaySelectedContent();
         }
     }
     
+    loadSampleData() {
+        const sampleElement = document.getElementById('sample-data');
+        return sampleElement ? JSON.parse(sampleElement.textContent) : {};
+    }
+    
     fileContainsFilteredContent(data) {
         if (!Array.isArray(data)) return false;
         
-        return data.some(item => 
-            item && 
-            typeof item === 'object' &&
-            item.type === this.typeFilter && 
-            item.summary && 
-            typeof item.summary === 'string' && 
-            item.summary.includes(this.contentFilter)
-        );
+        const typeFilter = this.typeFilter;
+        const contentFilter = this.contentFilter;
+        // Primitives have no type property, so the type check alone rules them out
+        return data.some(item => {
+            if (item == null || item.type !== typeFilter) return false;
+            const summary = item.summary;
+            return typeof summary === 'string' && summary !== '' && summary.includes(contentFilter);
+        });
     }
     
     updateFilterInfo(count) {
@@ -213,11 +228,11 @@ class LearningContentViewer {
     async handleFileSelection(fileName) {
         try {
             // Check if this is sample data
-            if (SAMPLE_DATA[fileName]) {
-                this.currentJsonData = SAMPLE_DATA[fileName];
+            if (this.sampleData && this.sampleData[fileName]) {
+                this.setCurrentData(this.sampleData[fileName]);
             } else {
                 // Try to load from server
-                this.currentJsonData = await this.loadJsonFile(fileName);
+                this.setCurrentData(await this.loadJsonFile(fileName));
             }
             
             this.updateTypeButtons();
@@ -228,6 +243,25 @@ class LearningContentViewer {
         }
     }
     
+    setCurrentData(data) {
+        this.currentJsonData = data;
+        
+        // Group items by type once so buttons and content views don't re-filter the whole file
+        this.currentItemsByType = new Map();
+        if (!Array.isArray(data)) return;
+        
+        for (const item of data) {
+            if (item && typeof item === 'object' && item.type) {
+                const items = this.currentItemsByType.get(item.type);
+                if (items) {
+                    items.push(item);
+                } else {
+                    this.currentItemsByType.set(item.type, [item]);
+                }
+            }
+        }
+    }
+    
     updateTypeButtons() {
         if (!this.currentJsonData) return;
         
@@ -235,11 +269,7 @@ class LearningContentViewer {
         this.typeButtonsContainer.innerHTML = '';
         
         // Get unique types
-        const types = [...new Set(
-            this.currentJsonData
-                .filter(item => item && typeof item === 'object' && item.type)
-                .map(item => item.type)
-        )].sort();
+        const types = Array.from(this.currentItemsByType.keys()).sort();
         
         if (types.length === 0) {
             this.typeButtonsContainer.innerHTML = '<p>No content types found</p>';
@@ -270,9 +300,7 @@ class LearningContentViewer {
             return;
         }
         
-        const contentItems = this.currentJsonData.filter(
-            item => item && typeof item === 'object' && item.type === typeName
-        );
+        const contentItems = this.currentItemsByType.get(typeName) || [];
         
         if (contentItems.length === 0) {
             this.contentOutput.innerHTML = `<p>No content found for type: ${typeName}</p>`;
@@ -295,18 +323,19 @@ class LearningContentViewer {
             contentHtml += `<p><em>This section contains '${this.contentFilter}'</em></p>`;
         }
         
+        // Only the filter type gets highlighted
+        const highlightPattern = typeName === this.typeFilter ? this.highlightPattern : null;
+        const highlightHtml = this.highlightHtml;
+        
         // Add each item's summary
         contentItems.forEach(item => {
             if (!item.summary) return;
             
             let summary = item.summary;
             
-            // Highlight filtered content if present
-            if (this.contentFilter && typeName === this.typeFilter && summary.includes(this.contentFilter)) {
-                summary = summary.replace(
-                    new RegExp(this.contentFilter, 'g'),
-                    `<span class="highlight">${this.contentFilter}</span>`
-                );
+            // Highlight filtered content if present; replace() leaves summaries without a match untouched
+            if (highlightPattern) {
+                summary = summary.replace(highlightPattern, () => highlightHtml);
             }
             
             // Convert markdown to HTML
@@ -323,15 +352,11 @@ class LearningContentViewer {
         }
         
         // First look for the type containing our filter text
-        const matchingItems = this.currentJsonData.filter(
-            item => item && 
-                   typeof item === 'object' && 
-                   item.type === this.typeFilter && 
-                   item.summary && 
-                   item.summary.includes(this.contentFilter)
+        const hasMatchingItems = (this.currentItemsByType.get(this.typeFilter) || []).some(
+            item => item.summary && item.summary.includes(this.contentFilter)
         );
         
-        if (matchingItems.length > 0) {
+        if (hasMatchingItems) {
             // Show the matching type first
             this.displayContentByType(this.typeFilter);
             